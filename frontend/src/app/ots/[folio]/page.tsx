@@ -2834,21 +2834,14 @@ export default function OTDetailPage({ params }: { params: Promise<{ folio: stri
                       <div className="flex items-center justify-between">
                         <span className="text-sm font-medium text-gray-500">Prioridad</span>
                         {puedeEditar('todos') && !isEditingPrioridad && (
-                          <>
-                            {/* Debug temporal - remover después */}
-                            {console.log('🔍 DEBUG PRIORIDAD: puedeEditar("todos"):', puedeEditar('todos'), 'user?.rol:', user?.rol, 'isEditingPrioridad:', isEditingPrioridad)}
-                            <Button
-                              variant="ghost"
-                              size="sm"
-                              onClick={() => {
-                                console.log('📝 Haciendo click en editar prioridad');
-                                setIsEditingPrioridad(true);
-                              }}
-                              className="h-6 w-6 p-0 hover:bg-gray-100"
-                            >
-                              <Edit3 className="h-3 w-3 text-gray-400" />
-                            </Button>
-                          </>
+                          <Button
+                            variant="ghost"
+                            size="sm"
+                            onClick={() => setIsEditingPrioridad(true)}
+                            className="h-6 w-6 p-0 hover:bg-gray-100"
+                          >
+                            <Edit3 className="h-3 w-3 text-gray-400" />
+                          </Button>
                         )}
                       </div>
                       {isEditingPrioridad ? (
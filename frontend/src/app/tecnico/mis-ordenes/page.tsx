@@ -76,6 +76,13 @@ interface TechnicianOT {
   } | null;
 }
 
+// Colores por prioridad (mismo patrón que PRIORIDAD_COLORS en tickets-table)
+const PRIORIDAD_COLORS: Record<string, string> = {
+  'alta': 'bg-red-100 text-red-800',
+  'media': 'bg-yellow-100 text-yellow-800',
+  'baja': 'bg-green-100 text-green-800'
+};
+
 export default function MisOrdenesPage() {
   const { user, logout } = useAuth();
   const router = useRouter();
@@ -236,18 +243,8 @@ export default function MisOrdenesPage() {
   };
 
   // Función para obtener el color de la prioridad
-  const getPrioridadColor = (prioridad: string) => {
-    switch (prioridad?.toLowerCase()) {
-      case 'alta':
-        return 'bg-red-100 text-red-800';
-      case 'media':
-        return 'bg-yellow-100 text-yellow-800';
-      case 'baja':
-        return 'bg-green-100 text-green-800';
-      default:
-        return 'bg-gray-100 text-gray-800';
-    }
-  };
+  const getPrioridadColor = (prioridad: string) =>
+    PRIORIDAD_COLORS[prioridad?.toLowerCase()] || 'bg-gray-100 text-gray-800';
 
   // 🎯 Función para detectar el tipo de origen de una OT
   const getOrigenOT = (orden: TechnicianOT): 'tiendas' | 'planta' | 'comercial' => {
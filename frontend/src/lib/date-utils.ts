@@ -5,6 +5,40 @@
 
 const COLOMBIA_TZ = 'America/Bogota';
 
+// Formateadores cacheados a nivel de módulo: cada llamada a toLocaleString
+// construye un Intl.DateTimeFormat nuevo (costoso); reutilizarlos hace que
+// formatear en tablas/listas grandes sea solo un .format() por fecha
+const SHORT_FORMATTER = new Intl.DateTimeFormat('es-CO', {
+  timeZone: COLOMBIA_TZ,
+  day: '2-digit',
+  month: '2-digit',
+  year: 'numeric',
+  hour: '2-digit',
+  minute: '2-digit',
+  hour12: false
+});
+
+const DATE_FORMATTER = new Intl.DateTimeFormat('es-CO', {
+  timeZone: COLOMBIA_TZ,
+  day: '2-digit',
+  month: '2-digit',
+  year: 'numeric'
+});
+
+const LONG_DATE_FORMATTER = new Intl.DateTimeFormat('es-CO', {
+  timeZone: COLOMBIA_TZ,
+  day: '2-digit',
+  month: 'long',
+  year: 'numeric'
+});
+
+const TIME_FORMATTER = new Intl.DateTimeFormat('es-CO', {
+  timeZone: COLOMBIA_TZ,
+  hour: '2-digit',
+  minute: '2-digit',
+  hour12: false
+});
+
 /**
  * Formatea una fecha en la zona horaria de Colombia (UTC-5)
  * 
@@ -33,48 +67,16 @@ export function formatColombiaDateTime(
     switch (format) {
       case 'short':
         // Formato: "dd/mm/yyyy HH:MM"
-        return dateObj.toLocaleString('es-CO', {
-          timeZone: COLOMBIA_TZ,
-          day: '2-digit',
-          month: '2-digit',
-          year: 'numeric',
-          hour: '2-digit',
-          minute: '2-digit',
-          hour12: false
-        }).replace(',', '');
-      
+        return SHORT_FORMATTER.format(dateObj).replace(',', '');
+
       case 'long':
         // Formato: "dd de Month de yyyy a las HH:MM"
-        const datePart = dateObj.toLocaleDateString('es-CO', {
-          timeZone: COLOMBIA_TZ,
-          day: '2-digit',
-          month: 'long',
-          year: 'numeric'
-        });
-        const timePart = dateObj.toLocaleTimeString('es-CO', {
-          timeZone: COLOMBIA_TZ,
-          hour: '2-digit',
-          minute: '2-digit',
-          hour12: false
-        });
-        return `${datePart} a las ${timePart}`;
-      
+        return `${LONG_DATE_FORMATTER.format(dateObj)} a las ${TIME_FORMATTER.format(dateObj)}`;
+
       case 'default':
       default:
         // Formato: "dd/mm/yyyy a las HH:MM"
-        const datePartDefault = dateObj.toLocaleDateString('es-CO', {
-          timeZone: COLOMBIA_TZ,
-          day: '2-digit',
-          month: '2-digit',
-          year: 'numeric'
-        });
-        const timePartDefault = dateObj.toLocaleTimeString('es-CO', {
-          timeZone: COLOMBIA_TZ,
-          hour: '2-digit',
-          minute: '2-digit',
-          hour12: false
-        });
-        return `${datePartDefault} a las ${timePartDefault}`;
+        return `${DATE_FORMATTER.format(dateObj)} a las ${TIME_FORMATTER.format(dateObj)}`;
     }
   } catch (error) {
     console.error('❌ [formatColombiaDateTime] Error al formatear fecha:', error, 'Fecha original:', date);